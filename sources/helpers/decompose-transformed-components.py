@@ -8,12 +8,7 @@ bad_components_ls = []
 def check_for_only_one_comp(glyph):
 	for thisLayer in glyph.layers:
 		for thisComponent in thisLayer.components:
-			if sum(thisComponent.scale) != 2.0:
-				print glyph
-				bad_components.append(glyph)
-				bad_components_ls.append(glyph.name)
-				return
-			elif thisComponent.rotation != 0.0:
+			if sum(thisComponent.scale) != 2.0 or thisComponent.rotation != 0.0:
 				print glyph
 				bad_components.append(glyph)
 				bad_components_ls.append(glyph.name)
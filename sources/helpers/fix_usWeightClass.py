@@ -10,13 +10,16 @@ import os.path
 from fontTools.ttLib import TTFont
 
 # Helper to find files
+# Accepts a single extension or a tuple of them, so several
+# formats can be collected with one walk of the tree
 def getFiles(path, extension):
-    if not extension.startswith('.'):
-        extension = '.' + extension
-    if extension == '.ufo':
-        return [dir for (dir, dirs, files) in os.walk(path) if dir[-len(extension):] == extension]
+    if isinstance(extension, str):
+        extension = (extension,)
+    extension = tuple(ext if ext.startswith('.') else '.' + ext for ext in extension)
+    if '.ufo' in extension:
+        return [dir for (dir, dirs, files) in os.walk(path) if dir.endswith(extension)]
     else:
-        return [os.sep.join((dir, file)) for (dir, dirs, files) in os.walk(path) for file in files if file[-len(extension):] == extension]
+        return [os.sep.join((dir, file)) for (dir, dirs, files) in os.walk(path) for file in files if file.endswith(extension)]
 
 def fixusWeightClass(fontPath):
     # Get Font object from path
@@ -59,8 +62,7 @@ def main():
     print ("-----------------------------------------------")
     print ("Working from:")
     print (os.getcwd())
-    files = getFiles(os.getcwd(), 'otf')
-    files += getFiles(os.getcwd(), 'ttf')
+    files = getFiles(os.getcwd(), ('otf', 'ttf'))
     print ("Found these fonts to fix:")
     print (files)
     for file in files:
@@ -6,7 +6,7 @@ from fontbakery.constants import PlatformID, WindowsEncodingID, WindowsLanguageI
 file = sys.argv[1]
 ttFont = fontTools.ttLib.TTFont(file)
 
-allowed_stylenames = (
+allowed_stylenames = frozenset((
 "Thin",
 "ExtraLight",
 "Light",
@@ -27,24 +27,30 @@ allowed_stylenames = (
 "ExtraBold Italic",
 "Black Italic",
 "ExtraBlack Italic",
-)
+))
 
 
-def forbidden_instance():
-    for instance in ttFont['fvar'].instances:
-        name = ttFont['name'].getName(
-          instance.subfamilyNameID,
-          PlatformID.WINDOWS,
-          WindowsEncodingID.UNICODE_BMP,
-          WindowsLanguageID.ENGLISH_USA
-        ).toUnicode()
+def forbidden_instance(instance):
+    name = ttFont['name'].getName(
+      instance.subfamilyNameID,
+      PlatformID.WINDOWS,
+      WindowsEncodingID.UNICODE_BMP,
+      WindowsLanguageID.ENGLISH_USA
+    ).toUnicode()
 
-        if not name in allowed_stylenames:
-            return instance
+    return not name in allowed_stylenames
 
-while forbidden_instance():
-    instance = forbidden_instance()
-    ttFont['fvar'].instances.remove(instance)
-    print('Deleted', instance)
+# filter the instances in one pass instead of rescanning after each removal
+kept = []
+deleted = False
+for instance in ttFont['fvar'].instances:
+    if forbidden_instance(instance):
+        print('Deleted', instance)
+        deleted = True
+    else:
+        kept.append(instance)
+ttFont['fvar'].instances = kept
 
-ttFont.save(file)
+# nothing to remove, leave the font untouched
+if deleted:
+    ttFont.save(file)